@@ -2,17 +2,42 @@
 from __future__ import print_function, absolute_import
 
 import sys
-
-from functools import partial
+from types import FunctionType
 
 import attr
 
 import six
 
-from ._continuation import trampoline
+
+def _chain_from_pairs(pairs):
+    """
+    Build a callback chain from ``(success, error)`` pairs given in the order
+    in which they should be run.
+    """
+    chain = None
+    for success, error in pairs:
+        chain = (success, error), chain
+    return chain
 
 
-@attr.s
+def _as_chain(callbacks):
+    """
+    Converter for ``Effect.callbacks``: a callback chain is kept as it is,
+    and anything else is taken to be an iterable of ``(success, error)``
+    pairs in the order in which they should be run.
+    """
+    if callbacks is None:
+        return None
+    if type(callbacks) is tuple and len(callbacks) == 2:
+        head, tail = callbacks
+        if type(head) is tuple and (
+                tail is None
+                or (type(tail) is tuple and tail and type(tail[0]) is tuple)):
+            return callbacks
+    return _chain_from_pairs(callbacks)
+
+
+@attr.s(repr=False, eq=False, slots=True)
 class Effect(object):
     """
     Take an object that describes a desired effect (called an "Intent"), and
@@ -21,10 +46,32 @@ class Effect(object):
     Effects can be performed with :func:`perform`.
 
     :param intent: The intent to be performed.
+    :param callbacks: The callbacks to bind, as an iterable of
+        ``(success, error)`` pairs in the order in which they should be run
+        (see :meth:`with_callbacks`). Usually callbacks are bound with
+        :meth:`on` instead.
+
+    The ``callbacks`` attribute is not a list: it's a persistent linked list
+    of ``(success, error)`` pairs, most recently bound first. It's either None
+    or a ``((success, error), tail)`` cell, where ``tail`` is another such
+    chain. Binding a callback shares the existing cells instead of copying
+    them.
     """
 
     intent = attr.ib()
-    callbacks = attr.ib(default=attr.Factory(list))
+    callbacks = attr.ib(default=None, converter=_as_chain)
+
+    @classmethod
+    def with_callbacks(cls, intent, callbacks):
+        """
+        Return a new Effect of ``intent`` with the given callbacks bound.
+
+        This is equivalent to calling :meth:`on` with each pair in turn.
+
+        :param callbacks: An iterable of ``(success, error)`` pairs, in the
+            order in which they should be run.
+        """
+        return cls(intent, callbacks=_chain_from_pairs(callbacks))
 
     def on(self, success=None, error=None):
         """
@@ -40,14 +87,64 @@ class Effect(object):
         If a callback returns an :obj:`Effect`, the result of that
         :obj:`Effect` will be passed to the next callback.
         """
-        return Effect(self.intent,
-                      callbacks=self.callbacks + [(success, error)])
+        # The new cell is already a chain, so skip __init__ and its converter.
+        effect = Effect.__new__(Effect)
+        effect.intent = self.intent
+        effect.callbacks = ((success, error), self.callbacks)
+        return effect
+
+    def __repr__(self):
+        return 'Effect(intent=%r, callbacks=%r)' % (
+            self.intent, _to_list(self.callbacks))
+
+    # Equality and pickling walk the callback chain in a loop; the generated
+    # versions would recurse once per callback.
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        if not self.intent == other.intent:
+            return False
+        chain, other_chain = self.callbacks, other.callbacks
+        while chain is not other_chain:
+            if chain is None or other_chain is None:
+                return False
+            head, chain = chain
+            other_head, other_chain = other_chain
+            if not head == other_head:
+                return False
+        return True
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        if result is NotImplemented:
+            return result
+        return not result
+
+    __hash__ = None
+
+    def __reduce__(self):
+        return (Effect, (self.intent, _to_list(self.callbacks)))
+
+
+def _to_list(chain):
+    """
+    Materialize a callback chain as a list of ``(success, error)`` pairs, in
+    the order in which they will be run.
+    """
+    result = []
+    while chain is not None:
+        head, chain = chain
+        result.append(head)
+    result.reverse()
+    return result
 
 
 class _Box(object):
     """
     An object into which an effect dispatcher can place a result.
     """
+    __slots__ = ('_cont',)
+
     def __init__(self, cont):
         """
         :param callable cont: Called with (bool is_error, result)
@@ -67,6 +164,56 @@ class _Box(object):
         self._cont((True, result))
 
 
+class _Resume(object):
+    """
+    The continuation that :func:`perform` wraps in a :obj:`_Box` for each
+    performer it invokes.
+
+    A result provided before the performer returns is stored so that the loop
+    in :func:`perform` can pick it up; a result provided afterwards restarts
+    that loop. The result isn't kept any longer than that, since an exc_info
+    would otherwise tie this object into a reference cycle with the frames
+    in its traceback, which usually include the performer holding the box.
+    """
+    __slots__ = ('_dispatcher', '_chain', '_result', '_provided', '_returned')
+
+    def __init__(self, dispatcher, chain):
+        self._dispatcher = dispatcher
+        self._chain = chain
+        self._result = None
+        self._provided = False
+        self._returned = False
+
+    def __call__(self, result):
+        if self._provided:
+            raise RuntimeError(
+                "Already provided a result, refusing to set to %r"
+                % (result,))
+        self._provided = True
+        if self._returned:
+            _run(self._dispatcher, self._chain, result)
+        else:
+            self._result = result
+
+    def returned(self):
+        """
+        Note that the performer has returned, and return the result it has
+        provided so far, if any.
+        """
+        self._returned = True
+        result, self._result = self._result, None
+        return result
+
+    def raised(self):
+        """
+        Note that the performer has raised an exception, and return the result
+        it provided before raising, if any. That result takes precedence over
+        the exception, and the box refuses any result provided afterwards.
+        """
+        self._provided = True
+        return self.returned()
+
+
 def guard(f, *args, **kwargs):
     """
     Run a function.
@@ -127,40 +274,81 @@ def perform(dispatcher, effect):
        a ``sys.exc_info()``-style tuple. Decorators like :func:`sync_performer`
        simply abstract this away.
     """
-    def _run_callbacks(bouncer, chain, result):
-        is_error, value = result
+    _run(dispatcher, None, None, effect)
 
-        if type(value) is Effect:
-            bouncer.bounce(
-                _perform,
-                Effect(value.intent, callbacks=value.callbacks + chain))
-            return
-
-        if not chain:
-            return
-
-        cb = chain[0][is_error]
-        if cb is not None:
-            result = guard(cb, value)
-        chain = chain[1:]
-        bouncer.bounce(_run_callbacks, chain, result)
-
-    def _perform(bouncer, effect):
-        try:
-            performer = dispatcher(effect.intent)
-            if performer is None:
-                raise NoPerformerFoundError(effect.intent)
+
+def _run(dispatcher, chain, result, effect=None):
+    """
+    The loop behind :func:`perform`.
+
+    Everything happens in this one frame, so neither long chains of callbacks
+    nor Effects returned from callbacks grow the stack. ``chain`` is a linked
+    list of the callbacks still to be run, in the order they should be run
+    (the reverse of ``Effect.callbacks``). If ``effect`` is given, it's
+    performed first; otherwise the callbacks are run with ``result``.
+
+    :return: The final ``(is_error, result)`` if everything finished
+        synchronously, otherwise None.
+    """
+    while True:
+        if effect is not None:
+            # Put the Effect's callbacks in front of the ones still waiting,
+            # oldest first. This only walks the Effect's own callbacks.
+            intent, callbacks = effect.intent, effect.callbacks
+            while callbacks is not None:
+                head, callbacks = callbacks
+                chain = (head, chain)
+            resume = None
+            try:
+                performer = dispatcher(intent)
+                if performer is None:
+                    raise NoPerformerFoundError(intent)
+                # Functions decorated with sync_performer are called directly.
+                # Bound methods and partials of them still get a box, since
+                # calling the wrapped function would lose their arguments, and
+                # so do other functions that merely wrap one.
+                sync = (getattr(performer, '_sync_performer', None)
+                        if type(performer) is FunctionType else None)
+                if sync is not None and sync[0] is performer.__code__:
+                    value = sync[1](dispatcher, intent)
+                    if chain is None and type(value) is not Effect:
+                        # Nothing left to run, e.g. performing an Effect that
+                        # has no callbacks.
+                        return (False, value)
+                    result = (False, value)
+                else:
+                    resume = _Resume(dispatcher, chain)
+                    performer(dispatcher, intent, _Box(resume))
+                    result = resume.returned()
+            except:
+                result = resume.raised() if resume is not None else None
+                if result is None:
+                    result = (True, sys.exc_info())
             else:
-                performer(
-                    dispatcher,
-                    effect.intent,
-                    _Box(partial(bouncer.bounce,
-                                 _run_callbacks, effect.callbacks)))
-        except:
-            e = sys.exc_info()
-            _run_callbacks(bouncer, effect.callbacks, (True, e))
-
-    trampoline(_perform, effect)
+                if result is None:
+                    # The performer is asynchronous; _Resume will call _run
+                    # again when the result is available.
+                    return
+
+        is_error, value = result
+        while type(value) is not Effect:
+            if chain is None:
+                try:
+                    return (is_error, value)
+                finally:
+                    # An exc_info's traceback refers to this frame; drop the
+                    # references to it so they don't form a reference cycle.
+                    result = value = resume = None
+            head, chain = chain
+            cb = head[is_error]
+            if cb is not None:
+                # This is guard(), inlined to save a call per callback.
+                try:
+                    value = cb(value)
+                    is_error = False
+                except:
+                    is_error, value = True, sys.exc_info()
+        effect = value
 
 
 def catch(exc_type, callable):
@@ -4,8 +4,6 @@ Dispatcher!
 
 import attr
 
-from six.moves import filter
-
 
 @attr.s
 class TypeDispatcher(object):
@@ -33,4 +31,8 @@ class ComposedDispatcher(object):
     dispatchers = attr.ib()
 
     def __call__(self, intent):
-        return next(filter(None, (d(intent) for d in self.dispatchers)), None)
+        for dispatcher in self.dispatchers:
+            performer = dispatcher(intent)
+            if performer:
+                return performer
+        return None
@@ -20,7 +20,7 @@ from ._sync import sync_performer
 from ._dispatcher import TypeDispatcher
 
 
-@attr.s
+@attr.s(slots=True)
 class ParallelEffects(object):
     """
     An effect intent that asks for a number of effects to be run in parallel,
@@ -7,7 +7,7 @@ Tools for dealing with Effects synchronously.
 import six
 import sys
 
-from ._base import perform
+from ._base import _run
 from ._utils import wraps
 
 
@@ -24,17 +24,20 @@ def sync_perform(dispatcher, effect):
     callbacks) be synchronous. If the result is not available immediately,
     :class:`NotSynchronousError` will be raised.
     """
-    successes = []
-    errors = []
-    effect = effect.on(success=successes.append, error=errors.append)
-    perform(dispatcher, effect)
-    if successes:
-        return successes[0]
-    elif errors:
-        six.reraise(*errors[0])
-    else:
+    # Rather than binding callbacks to collect the result, take it straight
+    # from the loop that perform uses.
+    result = _run(dispatcher, None, None, effect)
+    if result is None:
         raise NotSynchronousError("Performing %r was not synchronous!"
                                   % (effect,))
+    is_error, value = result
+    if is_error:
+        del result
+        try:
+            six.reraise(*value)
+        finally:
+            del value
+    return value
 
 
 def sync_performer(f):
@@ -67,9 +70,13 @@ def sync_performer(f):
     @wraps(f)
     def sync_wrapper(*args, **kwargs):
         box = args[-1]
-        pass_args = args[:-1]
         try:
-            box.succeed(f(*pass_args, **kwargs))
+            box.succeed(f(*args[:-1], **kwargs))
         except:
             box.fail(sys.exc_info())
+    # Lets perform call ``f`` directly, without allocating a box. The
+    # wrapper's code is recorded too: wraps() copies this attribute onto
+    # functions that wrap sync_wrapper, and those must still be called
+    # themselves. (Recording the wrapper itself would make a reference cycle.)
+    sync_wrapper._sync_performer = (sync_wrapper.__code__, f)
     return sync_wrapper
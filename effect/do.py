@@ -104,8 +104,7 @@ def _do(result, generator, is_error):
         # case where some other code is raising StopIteration up through this
         # generator, in which case we shouldn't really treat it like a function
         # return -- it could quite easily hide bugs.
-        tb = sys.exc_info()[2]
-        if tb.tb_next:
+        if sys.exc_info()[2].tb_next:
             raise
         else:
             # Python 3 allows you to use `return val` in a generator, which
@@ -21,6 +21,9 @@ def perform_parallel_async(dispatcher, intent, box):
         return
     num_results = count()
     results = [None] * len(effects)
+    # Set once the first child fails; results that arrive after that are
+    # dropped instead of being handed to the box.
+    failed = []
 
     def succeed(index, result):
         results[index] = result
@@ -28,6 +31,9 @@ def perform_parallel_async(dispatcher, intent, box):
             box.succeed(results)
 
     def fail(index, result):
+        if failed:
+            return
+        failed.append(index)
         box.fail((FirstError,
                   FirstError(exc_info=result, index=index),
                   result[2]))
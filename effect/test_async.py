@@ -2,9 +2,10 @@ from __future__ import print_function
 
 from testtools.testcase import TestCase
 
-from ._base import Effect, perform
+from ._base import Effect, _Box, perform
 from ._dispatcher import ComposedDispatcher, TypeDispatcher
-from ._intents import ParallelEffects, base_dispatcher, parallel
+from ._intents import FirstError, ParallelEffects, base_dispatcher, parallel
+from ._test_utils import get_exc_info
 from .parallel_async import perform_parallel_async
 from .test_base import func_dispatcher
 from .test_parallel_performers import ParallelPerformerTestsMixin
@@ -41,3 +42,30 @@ class PerformParallelAsyncTests(TestCase, ParallelPerformerTestsMixin):
         self.assertEqual(result, [])
         boxes[0].succeed('b')
         self.assertEqual(result[0], ['b', 'a'])
+
+    def test_synchronous_children(self):
+        """
+        When all child effects are performed synchronously, the result is
+        provided before the performer returns.
+        """
+        results = []
+        intent = ParallelEffects([Effect(lambda box: box.succeed('a')),
+                                  Effect(lambda box: box.succeed('b'))])
+        box = _Box(results.append)
+        perform_parallel_async(func_dispatcher, intent, box)
+        self.assertEqual(results, [(False, ['a', 'b'])])
+
+    def test_only_first_error(self):
+        """
+        Only the first child error is provided to the box; later errors are
+        ignored.
+        """
+        results = []
+        intent = ParallelEffects([
+            Effect(lambda box: box.fail(get_exc_info(ValueError('a')))),
+            Effect(lambda box: box.fail(get_exc_info(ValueError('b')))),
+        ])
+        perform_parallel_async(func_dispatcher, intent, _Box(results.append))
+        self.assertEqual(len(results), 1)
+        is_error, (exc_type, exc, tb) = results[0]
+        self.assertEqual((is_error, exc_type, exc.index), (True, FirstError, 0))
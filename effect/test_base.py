@@ -1,7 +1,11 @@
 from __future__ import print_function, absolute_import
 
+import copy
+import gc
+import pickle
 import sys
 import traceback
+import weakref
 
 from testtools import TestCase
 from testtools.matchers import MatchesException, MatchesListwise
@@ -20,6 +24,96 @@ def func_dispatcher(intent):
     return performer
 
 
+class EffectTests(TestCase):
+    """Tests for :obj:`Effect`."""
+
+    def test_on_shares_callbacks(self):
+        """
+        Binding callbacks doesn't copy or modify the callbacks of the original
+        Effect.
+        """
+        eff = Effect('foo').on(success=1)
+        eff2 = eff.on(success=2)
+        self.assertIs(eff2.callbacks[1], eff.callbacks)
+        self.assertEqual(eff, Effect('foo').on(success=1))
+
+    def test_with_callbacks(self):
+        """
+        ``with_callbacks`` binds callbacks from any iterable of pairs, in the
+        order they're given.
+        """
+        self.assertEqual(
+            Effect.with_callbacks('foo', iter([[1, None], (None, 2)])),
+            Effect('foo').on(success=1).on(error=2))
+
+    def test_callbacks_argument(self):
+        """
+        Callbacks passed to the constructor as a sequence of pairs are bound
+        in order, even when there are exactly two of them.
+        """
+        self.assertEqual(
+            Effect('foo', callbacks=[(1, None), (None, 2)]),
+            Effect('foo').on(success=1).on(error=2))
+        self.assertEqual(
+            Effect('foo', callbacks=[(1, None)]),
+            Effect('foo').on(success=1))
+        self.assertEqual(
+            Effect('foo', callbacks=((1, None), (None, 2))),
+            Effect('foo').on(success=1).on(error=2))
+
+    def test_callbacks_argument_performed(self):
+        """
+        Callbacks passed to the constructor are run by :func:`perform`.
+        """
+        calls = []
+        eff = Effect(lambda box: box.succeed(1),
+                     callbacks=[(lambda r: r * 10, None),
+                                (lambda r: r * 2, None),
+                                (calls.append, None)])
+        perform(func_dispatcher, eff)
+        self.assertEqual(calls, [20])
+
+    def test_long_chain_equality(self):
+        """
+        Effects with more callbacks than the recursion limit can be compared.
+        """
+        def build(n):
+            eff = Effect('foo')
+            for i in range(n):
+                eff = eff.on(success=i)
+            return eff
+        n = sys.getrecursionlimit() + 10
+        self.assertEqual(build(n), build(n))
+        self.assertNotEqual(build(n), build(n).on(success=0))
+        self.assertNotEqual(build(n), build(n - 1).on(success=0))
+
+    def test_long_chain_deepcopy(self):
+        """
+        Effects with more callbacks than the recursion limit can be deep
+        copied.
+        """
+        eff = Effect('foo')
+        for i in range(sys.getrecursionlimit() + 10):
+            eff = eff.on(success=i)
+        self.assertEqual(copy.deepcopy(eff), eff)
+
+    def test_long_chain_pickle(self):
+        """
+        Effects with more callbacks than the recursion limit can be pickled.
+        """
+        eff = Effect('foo')
+        for i in range(sys.getrecursionlimit() + 10):
+            eff = eff.on(success=i, error=str(i))
+        self.assertEqual(pickle.loads(pickle.dumps(eff)), eff)
+
+    def test_repr(self):
+        """The callbacks are shown in the order that they will be run."""
+        eff = Effect('foo').on(success=1).on(error=2)
+        self.assertEqual(
+            repr(eff),
+            "Effect(intent='foo', callbacks=[(1, None), (None, 2)])")
+
+
 class EffectPerformTests(TestCase):
     """Tests for perform."""
 
@@ -262,6 +356,78 @@ class EffectPerformTests(TestCase):
                 Effect(get_stack).on(success=lambda _: Effect(get_stack)))
         self.assertEqual(calls[0], calls[1])
 
+    def test_error_not_kept_in_reference_cycle(self):
+        """
+        When an effect fails and nothing handles the error, the frames in its
+        traceback are freed as soon as ``perform`` returns, without waiting for
+        the garbage collector.
+        """
+        class Marker(object):
+            pass
+        refs = []
+
+        def performer(dispatcher, intent, box):
+            marker = Marker()
+            refs.append(weakref.ref(marker))
+            raise ValueError('oh dear')
+
+        gc.disable()
+        try:
+            perform(lambda i: performer, Effect('meaningless'))
+        finally:
+            gc.enable()
+        self.assertIs(refs[0](), None)
+
+    def test_box_only_filled_once(self):
+        """
+        A box refuses to accept a second result, and the callbacks are only
+        run once.
+        """
+        calls = []
+        errors = []
+
+        def succeed_twice(box):
+            box.succeed('foo')
+            errors.append(self.assertRaises(RuntimeError, box.succeed, 'bar'))
+        perform(func_dispatcher,
+                Effect(succeed_twice).on(success=calls.append))
+        self.assertEqual(calls, ['foo'])
+        self.assertEqual(len(errors), 1)
+
+    def test_box_not_filled_after_raising(self):
+        """
+        Once the performer has raised, its box refuses a result, and only the
+        error callbacks are run.
+        """
+        calls = []
+        boxes = []
+
+        def raise_later(box):
+            boxes.append(box)
+            raise ValueError('oops')
+        perform(func_dispatcher,
+                Effect(raise_later).on(
+                    success=lambda r: calls.append(('ok', r)),
+                    error=lambda e: calls.append(('err', e[0]))))
+        self.assertRaises(RuntimeError, boxes[0].succeed, 5)
+        self.assertEqual(calls, [('err', ValueError)])
+
+    def test_box_filled_before_raising(self):
+        """
+        If the performer fills its box and then raises, the result in the box
+        is used and the exception is ignored.
+        """
+        calls = []
+
+        def succeed_then_raise(box):
+            box.succeed('foo')
+            raise ValueError('oops')
+        perform(func_dispatcher,
+                Effect(succeed_then_raise).on(
+                    success=lambda r: calls.append(('ok', r)),
+                    error=lambda e: calls.append(('err', e[0]))))
+        self.assertEqual(calls, [('ok', 'foo')])
+
     def test_asynchronous_callback_invocation(self):
         """
         When an Effect that is returned by a callback is resolved
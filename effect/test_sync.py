@@ -1,9 +1,11 @@
+import functools
+import traceback
 from functools import partial
 
 from testtools import TestCase
 from testtools.matchers import MatchesException, raises
 
-from ._base import Effect
+from ._base import Effect, perform
 from ._sync import NotSynchronousError, sync_perform, sync_performer
 
 
@@ -73,6 +75,54 @@ class SyncPerformerTests(TestCase):
                          Effect(ValueError('oh dear')).on(error=lambda e: e)),
             MatchesException(ValueError('oh dear')))
 
+    def test_called_directly_by_perform(self):
+        """
+        ``perform`` calls the decorated function directly, instead of going
+        through the wrapper and a box.
+        """
+        @sync_performer
+        def succeed(dispatcher, intent):
+            return [frame[2] for frame in traceback.extract_stack()]
+
+        dispatcher = lambda _: succeed
+        result = sync_perform(dispatcher, Effect("foo"))
+        self.assertNotIn('sync_wrapper', result)
+
+    def test_wrapped_performer_called(self):
+        """
+        A function that wraps a sync_performer with ``functools.wraps`` is
+        still called by ``perform``, rather than the function it wraps.
+        """
+        calls = []
+
+        @sync_performer
+        def performer(dispatcher, intent):
+            return intent
+
+        @functools.wraps(performer)
+        def logged(dispatcher, intent, box):
+            calls.append(intent)
+            return performer(dispatcher, intent, box)
+
+        result = sync_perform(lambda _: logged, Effect(3))
+        self.assertEqual((result, calls), (3, [3]))
+
+    def test_returned_effect_without_callbacks(self):
+        """
+        When an Effect without callbacks is performed and its performer
+        returns another Effect, that Effect is still performed.
+        """
+        calls = []
+
+        @sync_performer
+        def performer(dispatcher, intent):
+            if intent == 'outer':
+                return Effect('inner')
+            calls.append(intent)
+
+        perform(lambda _: performer, Effect('outer'))
+        self.assertEqual(calls, ['inner'])
+
     def test_instance_method_performer(self):
         """The decorator works on instance methods."""
         eff = Effect('meaningless')
@@ -181,7 +181,7 @@ class ResolveStubsTests(TestCase):
         eff = ESConstant("foo").on(success=lambda r: bare_effect)
         result_eff = resolve_stubs(base_dispatcher, eff)
         self.assertIs(result_eff.intent, bare_effect.intent)
-        self.assertEqual(result_eff.callbacks, [])
+        self.assertIs(result_eff.callbacks, None)
 
     def test_type_error(self):
         """
@@ -220,6 +220,21 @@ class ResolveStubsTests(TestCase):
         result2 = resolve_effect(result, "bar")
         self.assertEqual(result2, ("callbacked", "bar"))
 
+    def test_intermediate_effect_callbacks_run_before_outer_callbacks(self):
+        """
+        When a non-stub effect with its own callbacks is returned from a
+        callback, its callbacks come before the outer effect's remaining
+        callbacks.
+        """
+        eff = ESConstant("foo").on(
+            success=lambda r: Effect("something").on(lambda r: ("inner", r))
+        ).on(
+            lambda r: ("outer", r))
+        result = resolve_stubs(base_dispatcher, eff)
+        self.assertEqual(result.intent, "something")
+        self.assertEqual(resolve_effect(result, "bar"),
+                         ("outer", ("inner", "bar")))
+
     def test_parallel_stubs(self):
         """Parallel effects are recursively resolved."""
         p_eff = parallel([ESConstant(1), ESConstant(2)])
@@ -352,6 +367,55 @@ class SequenceDispatcherTests(TestCase):
         d = SequenceDispatcher([('foo', lambda i: 'bar')])
         self.assertFalse(d.consumed())
 
+    def test_sequence_remaining(self):
+        """``sequence`` only contains the steps that haven't been performed."""
+        bar = lambda i: 'bar'
+        d = SequenceDispatcher([('foo', bar), ('baz', bar)])
+        sync_perform(d, Effect('foo'))
+        self.assertEqual(d.sequence, [('baz', bar)])
+
+    def test_set_sequence(self):
+        """
+        Setting ``sequence`` replaces the steps still to be performed.
+        """
+        bar = lambda i: 'bar'
+        d = SequenceDispatcher([('foo', bar)])
+        sync_perform(d, Effect('foo'))
+        d.sequence = [('baz', bar)]
+        self.assertFalse(d.consumed())
+        self.assertEqual(sync_perform(d, Effect('baz')), 'bar')
+        self.assertTrue(d.consumed())
+
+    def test_sequence_copied(self):
+        """
+        The dispatcher keeps its own copy of the steps, so changing the list
+        it was given or the one ``sequence`` returns doesn't affect it.
+        """
+        bar = lambda i: 'bar'
+        steps = [('foo', bar)]
+        d = SequenceDispatcher(steps)
+        steps.append(('baz', bar))
+        d.sequence.append(('baz', bar))
+        self.assertEqual(d.sequence, [('foo', bar)])
+        steps = [('baz', bar)]
+        d.sequence = steps
+        steps.pop()
+        self.assertEqual(d.sequence, [('baz', bar)])
+
+    def test_repr(self):
+        """The repr only shows the steps that haven't been performed."""
+        d = SequenceDispatcher([('foo', None), ('bar', None)])
+        d('foo')
+        self.assertEqual(repr(d),
+                         "SequenceDispatcher(sequence=[('bar', None)])")
+
+    def test_equality(self):
+        """Dispatchers are equal when their remaining steps are equal."""
+        d = SequenceDispatcher([('foo', None), ('bar', None)])
+        d('foo')
+        self.assertEqual(d, SequenceDispatcher([('bar', None)]))
+        self.assertNotEqual(d, SequenceDispatcher([('foo', None)]))
+
     def test_consume_good(self):
         """``consume`` doesn't raise an error if all elements are consumed."""
         d = SequenceDispatcher([('foo', lambda i: 'bar')])
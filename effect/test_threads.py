@@ -6,8 +6,9 @@ from multiprocessing.pool import ThreadPool
 
 from testtools import TestCase
 
-from ._intents import ParallelEffects, base_dispatcher
+from ._intents import ParallelEffects, base_dispatcher, parallel
 from ._dispatcher import ComposedDispatcher, TypeDispatcher
+from ._sync import sync_perform
 from .threads import perform_parallel_with_pool
 from .test_parallel_performers import ParallelPerformerTestsMixin
 
@@ -22,3 +23,13 @@ class ParallelPoolPerformerTests(TestCase, ParallelPerformerTestsMixin):
         self.dispatcher = ComposedDispatcher([
             base_dispatcher,
             TypeDispatcher({ParallelEffects: self.p_performer})])
+
+    def test_empty_does_not_use_pool(self):
+        """
+        When there are no child effects, the result is provided without
+        submitting any work to the pool.
+        """
+        self.pool.close()
+        self.assertEqual(
+            sync_perform(self.dispatcher, parallel([])),
+            [])
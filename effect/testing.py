@@ -13,7 +13,8 @@ import sys
 
 import attr
 
-from ._base import Effect, guard, _Box, NoPerformerFoundError, raise_
+from ._base import (
+    Effect, guard, _Box, NoPerformerFoundError, raise_, _to_list)
 from ._sync import NotSynchronousError, sync_perform, sync_performer
 from ._intents import Constant, Error, Func, ParallelEffects, base_dispatcher
 
@@ -253,15 +254,16 @@ def resolve_effect(effect, result, is_error=False):
         treated as the result of the effect. If ``is_error`` is True, this must
         be a three-tuple in the style of ``sys.exc_info``.
     """
-    for i, (callback, errback) in enumerate(effect.callbacks):
+    callbacks = _to_list(effect.callbacks)
+    for i, (callback, errback) in enumerate(callbacks):
         cb = errback if is_error else callback
         if cb is None:
             continue
         is_error, result = guard(cb, result)
         if type(result) is Effect:
-            return Effect(
+            return Effect.with_callbacks(
                 result.intent,
-                callbacks=result.callbacks + effect.callbacks[i + 1:])
+                _to_list(result.callbacks) + callbacks[i + 1:])
     if is_error:
         six.reraise(*result)
     return result
@@ -287,29 +289,37 @@ def resolve_stub(dispatcher, effect):
     chains of stub effects.
     """
     if type(effect.intent) is Stub:
-        performer = dispatcher(effect.intent.intent)
-        if performer is None:
-            raise NoPerformerFoundError(effect.intent.intent)
-        result_slot = []
-        box = _Box(result_slot.append)
-        performer(dispatcher, effect.intent.intent, box)
-        if len(result_slot) == 0:
-            raise NotSynchronousError(
-                "Performer %r was not synchronous during stub resolution for "
-                "effect %r"
-                % (performer, effect))
-        if len(result_slot) > 1:
-            raise RuntimeError(
-                "Pathological error (too many box results) while running "
-                "performer %r for effect %r"
-                % (performer, effect))
-        return resolve_effect(effect, result_slot[0][1],
-                              is_error=result_slot[0][0])
+        is_error, result = _perform_stub(dispatcher, effect)
+        return resolve_effect(effect, result, is_error=is_error)
     else:
         raise TypeError("resolve_stub can only resolve stubs, not %r"
                         % (effect,))
 
 
+def _perform_stub(dispatcher, effect):
+    """
+    Synchronously perform the intent wrapped by the :obj:`Stub` intent of
+    ``effect``, and return ``(is_error, result)``.
+    """
+    performer = dispatcher(effect.intent.intent)
+    if performer is None:
+        raise NoPerformerFoundError(effect.intent.intent)
+    result_slot = []
+    box = _Box(result_slot.append)
+    performer(dispatcher, effect.intent.intent, box)
+    if len(result_slot) == 0:
+        raise NotSynchronousError(
+            "Performer %r was not synchronous during stub resolution for "
+            "effect %r"
+            % (performer, effect))
+    if len(result_slot) > 1:
+        raise RuntimeError(
+            "Pathological error (too many box results) while running "
+            "performer %r for effect %r"
+            % (performer, effect))
+    return result_slot[0]
+
+
 def resolve_stubs(dispatcher, effect):
     """
     DEPRECATED in favor of using :func:`perform_sequence`.
@@ -323,22 +333,51 @@ def resolve_stubs(dispatcher, effect):
     if type(effect) is not Effect:
         raise TypeError("effect must be Effect: %r" % (effect,))
 
+    # Like perform, keep the callbacks still to be run as a linked list in the
+    # order they'll be run, and put the callbacks of each returned Effect in
+    # front of it. Building a new Effect with all of the remaining callbacks
+    # at every step (as resolve_effect does) would be quadratic.
+    chain = None
     while type(effect) is Effect:
-        if type(effect.intent) is Stub:
-            effect = resolve_stub(dispatcher, effect)
-        elif type(effect.intent) is ParallelEffects:
-            if not all(isinstance(x.intent, Stub)
-                       for x in effect.intent.effects):
-                break
-            else:
-                effect = resolve_effect(
-                    effect,
-                    list(map(partial(resolve_stubs, dispatcher),
-                             effect.intent.effects)))
+        intent = effect.intent
+        if type(intent) is Stub:
+            is_error, value = _perform_stub(dispatcher, effect)
+        elif (type(intent) is ParallelEffects
+              and all(isinstance(x.intent, Stub) for x in intent.effects)):
+            is_error, value = False, list(map(partial(resolve_stubs, dispatcher),
+                                              intent.effects))
         else:
             break
 
-    return effect
+        callbacks = effect.callbacks
+        while callbacks is not None:
+            head, callbacks = callbacks
+            chain = (head, chain)
+
+        effect = None
+        while chain is not None:
+            (callback, errback), chain = chain
+            cb = errback if is_error else callback
+            if cb is None:
+                continue
+            is_error, value = guard(cb, value)
+            if type(value) is Effect:
+                effect = value
+                break
+        if effect is None:
+            if is_error:
+                six.reraise(*value)
+            effect = value
+    else:
+        return effect
+
+    if chain is None:
+        return effect
+    remaining = _to_list(effect.callbacks)
+    while chain is not None:
+        head, chain = chain
+        remaining.append(head)
+    return Effect.with_callbacks(effect.intent, remaining)
 
 
 @attr.s
@@ -426,7 +465,7 @@ class EQFDispatcher(object):
                 return sync_performer(lambda d, i: v(i))
 
 
-@attr.s
+@attr.s(repr=False, eq=False)
 class SequenceDispatcher(object):
     """
     A dispatcher which steps through a sequence of (intent, func) tuples and
@@ -446,19 +485,52 @@ class SequenceDispatcher(object):
 
     :param list sequence: Sequence of (intent, fn).
     """
-    sequence = attr.ib()
+    _sequence = attr.ib(converter=list)
+    # Index of the next step, so that performing a step doesn't copy the rest
+    # of the sequence.
+    _position = attr.ib(default=0, init=False)
+
+    @property
+    def sequence(self):
+        """
+        A copy of the (intent, fn) steps that haven't been performed yet.
+        Changing it doesn't affect the dispatcher; assign to ``sequence``
+        instead.
+        """
+        return self._sequence[self._position:]
+
+    @sequence.setter
+    def sequence(self, sequence):
+        self._sequence = list(sequence)
+        self._position = 0
+
+    def __repr__(self):
+        return 'SequenceDispatcher(sequence=%r)' % (self.sequence,)
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self.sequence == other.sequence
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        if result is NotImplemented:
+            return result
+        return not result
+
+    __hash__ = None
 
     def __call__(self, intent):
-        if len(self.sequence) == 0:
+        if self.consumed():
             return
-        exp_intent, func = self.sequence[0]
+        exp_intent, func = self._sequence[self._position]
         if intent == exp_intent:
-            self.sequence = self.sequence[1:]
+            self._position += 1
             return sync_performer(lambda d, i: func(i))
 
     def consumed(self):
         """Return True if all of the steps were performed."""
-        return len(self.sequence) == 0
+        return self._position >= len(self._sequence)
 
     @contextmanager
     def consume(self):
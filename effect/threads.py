@@ -29,6 +29,10 @@ def perform_parallel_with_pool(pool, dispatcher, parallel_effects):
     than 3.4.0.
     """
 
+    if not parallel_effects.effects:
+        # Nothing to hand off to the pool.
+        return []
+
     # pool.map raises whatever exception is raised first, which is the exact
     # behavior we want in this performer -- we just need to translate it to a
     # FirstError exception.
@@ -38,7 +42,10 @@ def perform_parallel_with_pool(pool, dispatcher, parallel_effects):
             return sync_perform(dispatcher, effect)
         except:
             exc_info = sys.exc_info()
-            six.reraise(FirstError,
-                        FirstError(exc_info=exc_info, index=index),
-                        exc_info[2])
+            try:
+                six.reraise(FirstError,
+                            FirstError(exc_info=exc_info, index=index),
+                            exc_info[2])
+            finally:
+                del exc_info
     return pool.map(perform_child, enumerate(parallel_effects.effects))